@@ -1,64 +1,76 @@
 import pandas as pd
-import json
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from src.utils.json_io import load_json
 
 # Load the dataset
 file_path = 'data/gold_standard_clean.json'
 
-with open(file_path, 'r') as f:
-    data = json.load(f)
+df = pd.DataFrame(load_json(file_path))
+
+SPLITS = {'DEV': 'Dev', 'TEST': 'Test', 'FEW-SHOT': 'Few-Shot'}
 
-df = pd.DataFrame(data)
+# Only the three splits reported in the table (the Total column sums these)
+df_splits = df[df['split'].isin(SPLITS)]
+
+# Per-row flags, so every count below is a single grouped sum
+flags = pd.DataFrame({
+    'split': df_splits['split'],
+    'pmcid': df_splits['pmcid'],
+    'binary': df_splits['outcome_type'] == 'binary',
+    'continuous': df_splits['outcome_type'] == 'continuous',
+    'graphic': (df_splits['is_data_in_figure_graphics'] == True) |
+               (df_splits['is_table_in_graphic_format'] == True),
+})
 
-def calculate_metrics(dataframe):
+counts = flags.groupby('split').agg(
+    n_rct=('pmcid', 'nunique'),
+    n_ico=('pmcid', 'size'),
+    n_binary=('binary', 'sum'),
+    n_continuous=('continuous', 'sum'),
+    n_graphic=('graphic', 'sum'),
+).reindex(list(SPLITS), fill_value=0)
+
+# Total: RCT count is recomputed on the union, the rest are plain sums
+counts.loc['Total'] = counts.sum()
+counts.loc['Total', 'n_rct'] = flags['pmcid'].nunique()
+
+def format_metrics(row):
     # Avoid division by zero if a split is empty
-    if dataframe.empty:
+    if row['n_ico'] == 0:
         return [0, 0, 0, 0, "0.0"]
 
-    # 1. Number of Unique RCT reports (using pmcid)
-    n_rct = dataframe['pmcid'].nunique()
-    
-    # 2. Number of ICO-triplets (total rows)
-    n_ico = len(dataframe)
-    
-    # 3. Number of binary outcomes
-    n_binary = len(dataframe[dataframe['outcome_type'] == 'binary'])
-    
-    # 4. Number of continuous outcomes
-    n_continuous = len(dataframe[dataframe['outcome_type'] == 'continuous'])
-    
-    # 5. % with data in figure or image table
-    has_graphic_data = dataframe[
-        (dataframe['is_data_in_figure_graphics'] == True) | 
-        (dataframe['is_table_in_graphic_format'] == True)
-    ]
-    pct_graphic = (len(has_graphic_data) / n_ico * 100)
-    
-    return [n_rct, n_ico, n_binary, n_continuous, f"{pct_graphic:.1f}"]
+    # % with data in figure or image table
+    pct_graphic = row['n_graphic'] / row['n_ico'] * 100
 
-# Calculate columns for each split
-dev_metrics = calculate_metrics(df[df['split'] == 'DEV'])
-test_metrics = calculate_metrics(df[df['split'] == 'TEST'])
-few_shot_metrics = calculate_metrics(df[df['split'] == 'FEW-SHOT'])
+    return [int(row['n_rct']), int(row['n_ico']), int(row['n_binary']), int(row['n_continuous']), f"{pct_graphic:.1f}"]
 
-# Calculate Total (sum of all three splits)
-# Note: We use the full dataframe filtered to these 3 splits to ensure Total represents the table contents
-df_total = df[df['split'].isin(['DEV', 'TEST', 'FEW-SHOT'])]
-total_metrics = calculate_metrics(df_total)
+columns = {name: format_metrics(counts.loc[split]) for split, name in SPLITS.items()}
+columns['Total'] = format_metrics(counts.loc['Total'])
 
-# Create the summary DataFrame
-summary_table = pd.DataFrame({
-    'Variable / Measure': [
-        'No. RCT reports',
-        'No. ICO-triplets',
-        'No. binary outcomes',
-        'No. continuous outcomes',
-        '% with data in figure or image table'
-    ],
-    'Dev': dev_metrics,
-    'Test': test_metrics,
-    'Few-Shot': few_shot_metrics,
-    'Total': total_metrics
-})
+# Row labels of the summary table
+measures = [
+    'No. RCT reports',
+    'No. ICO-triplets',
+    'No. binary outcomes',
+    'No. continuous outcomes',
+    '% with data in figure or image table'
+]
 
-# Display the table
-print(summary_table.to_latex(index=False, caption="Summary of dataset characteristics", label="tab:dataset_summary"))
\ No newline at end of file
+# Display the table (same layout DataFrame.to_latex produced, without the jinja2/Styler dependency)
+header = ['Variable / Measure', *columns]
+lines = [
+    r"\begin{table}",
+    r"\caption{Summary of dataset characteristics}",
+    r"\label{tab:dataset_summary}",
+    r"\begin{tabular}{" + "l" * len(header) + "}",
+    r"\toprule",
+    " & ".join(header) + r" \\",
+    r"\midrule",
+]
+for i, measure in enumerate(measures):
+    lines.append(" & ".join([measure, *(str(values[i]) for values in columns.values())]) + r" \\")
+lines += [r"\bottomrule", r"\end{tabular}", r"\end{table}", ""]
+print("\n".join(lines))
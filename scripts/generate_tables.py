@@ -47,7 +47,8 @@ def aggregate_results(root_dir):
         print(f"Error: Directory '{root_dir}' not found.")
         return {}
 
-    subdirs = [d for d in os.listdir(root_dir) if os.path.isdir(os.path.join(root_dir, d))]
+    with os.scandir(root_dir) as entries:
+        subdirs = [e.name for e in entries if e.is_dir()]
     print(f"Scanning {len(subdirs)} folders in {root_dir}...")
 
     for folder in subdirs:
@@ -117,6 +118,9 @@ def get_metric_value(results_data, model, setting, json_key, metric_name, data_s
 
 def generate_latex_tables(results_data):
     available_models = sorted(results_data.keys())
+
+    report = []
+    add = report.append
     
     # Define the rows
     field_map = [
@@ -135,22 +139,22 @@ def generate_latex_tables(results_data):
     # TABLE 1: HEAD-TO-HEAD (Zero-Shot)
     # Compares all models on F1 and RMSE
     # =========================================================
-    print("\n" + "%"*20 + " TABLE 1: ZERO-SHOT COMPARISON " + "%"*20 + "\n")
-    print(r"\begin{table}[ht]")
-    print(r"\centering")
-    print(r"\caption{Head-to-Head Comparison (Zero-Shot). Best scores in bold.}")
-    print(r"\label{tab:head_to_head}")
-    print(r"\small")
-    print(r"\setlength{\tabcolsep}{4pt}")
-    print(r"\begin{tabular}{l l c c}")
-    print(r"\toprule")
-    print(r"\textbf{Category} & \textbf{Model} & \textbf{F1 [95\% CI]} & \textbf{RMSE [95\% CI]} \\")
-    print(r"\midrule")
+    add("\n" + "%"*20 + " TABLE 1: ZERO-SHOT COMPARISON " + "%"*20 + "\n")
+    add(r"\begin{table}[ht]")
+    add(r"\centering")
+    add(r"\caption{Head-to-Head Comparison (Zero-Shot). Best scores in bold.}")
+    add(r"\label{tab:head_to_head}")
+    add(r"\small")
+    add(r"\setlength{\tabcolsep}{4pt}")
+    add(r"\begin{tabular}{l l c c}")
+    add(r"\toprule")
+    add(r"\textbf{Category} & \textbf{Model} & \textbf{F1 [95\% CI]} & \textbf{RMSE [95\% CI]} \\")
+    add(r"\midrule")
 
     setting = "Zero-Shot"
 
     for display_name, json_key in field_map:
-        print(f"\\multirow{{{len(available_models)}}}{{*}}{{\\textbf{{{display_name}}}}}")
+        add(f"\\multirow{{{len(available_models)}}}{{*}}{{\\textbf{{{display_name}}}}}")
         
         # 1. Find Bests for this specific row (Zero-Shot only)
         best_f1 = -1
@@ -175,7 +179,7 @@ def generate_latex_tables(results_data):
                     metrics = run_data.get("by_field", {}).get(json_key, {})
 
             if not metrics:
-                print(f" & {model} & - & - \\\\")
+                add(f" & {model} & - & - \\\\")
                 continue
 
             # Check Bests
@@ -189,13 +193,13 @@ def generate_latex_tables(results_data):
             f1_str = format_metric(metrics, "f1", is_percent=True, is_best=is_best_f1)
             rmse_str = format_metric(metrics, "rmse", is_percent=False, is_best=is_best_rmse)
             
-            print(f" & {model} & {f1_str} & {rmse_str} \\\\")
+            add(f" & {model} & {f1_str} & {rmse_str} \\\\")
         
-        print(r"\midrule")
+        add(r"\midrule")
 
-    print(r"\bottomrule")
-    print(r"\end{tabular}")
-    print(r"\end{table}")
+    add(r"\bottomrule")
+    add(r"\end{tabular}")
+    add(r"\end{table}")
 
     # =========================================================
     # TABLE 2: STRATEGY ANALYSIS (Gemini Only)
@@ -203,19 +207,19 @@ def generate_latex_tables(results_data):
     # =========================================================
     target_model = "Gemini-3-Pro" # Change this if you want to analyze a different model
     
-    print("\n" + "%"*20 + " TABLE 2: STRATEGY ANALYSIS " + "%"*20 + "\n")
-    print(r"\begin{table}[ht]")
-    print(r"\centering")
-    print(f"\\caption{{Effect of Prompting Strategy on {target_model}.}}")
-    print(r"\label{tab:strategy_analysis}")
-    print(r"\small")
-    print(r"\setlength{\tabcolsep}{5pt}")
-    print(r"\begin{tabular}{l c c c c}")
-    print(r"\toprule")
-    print(r"& \multicolumn{2}{c}{\textbf{F1 Score}} & \multicolumn{2}{c}{\textbf{RMSE}} \\")
-    print(r"\cmidrule(lr){2-3} \cmidrule(lr){4-5}")
-    print(r"\textbf{Category} & \textbf{Zero-Shot} & \textbf{Few-Shot} & \textbf{Zero-Shot} & \textbf{Few-Shot} \\")
-    print(r"\midrule")
+    add("\n" + "%"*20 + " TABLE 2: STRATEGY ANALYSIS " + "%"*20 + "\n")
+    add(r"\begin{table}[ht]")
+    add(r"\centering")
+    add(f"\\caption{{Effect of Prompting Strategy on {target_model}.}}")
+    add(r"\label{tab:strategy_analysis}")
+    add(r"\small")
+    add(r"\setlength{\tabcolsep}{5pt}")
+    add(r"\begin{tabular}{l c c c c}")
+    add(r"\toprule")
+    add(r"& \multicolumn{2}{c}{\textbf{F1 Score}} & \multicolumn{2}{c}{\textbf{RMSE}} \\")
+    add(r"\cmidrule(lr){2-3} \cmidrule(lr){4-5}")
+    add(r"\textbf{Category} & \textbf{Zero-Shot} & \textbf{Few-Shot} & \textbf{Zero-Shot} & \textbf{Few-Shot} \\")
+    add(r"\midrule")
 
     for display_name, json_key in field_map:
         row_str = f"\\textbf{{{display_name}}} "
@@ -268,11 +272,13 @@ def generate_latex_tables(results_data):
                 val_str = f"\\textbf{{{val_str}}}"
         row_str += f"& {val_str} \\\\"
 
-        print(row_str)
+        add(row_str)
+
+    add(r"\bottomrule")
+    add(r"\end{tabular}")
+    add(r"\end{table}")
 
-    print(r"\bottomrule")
-    print(r"\end{tabular}")
-    print(r"\end{table}")
+    print("\n".join(report))
 
 if __name__ == "__main__":
     if os.path.exists(RESULTS_DIR):
@@ -1,4 +1,3 @@
-import json
 import argparse
 import sys
 import os
@@ -13,6 +12,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import RESULTS_DIR
 from src.utils.data_loader import DataLoader
+from src.utils.json_io import dump_json
 from src.utils.WIP_parsing import clean_and_parse_json 
 from src.prompts.builder import PromptBuilder
 from src.models.gpt import GPTModel
@@ -79,8 +79,7 @@ def save_result(pmcid: str, data: dict, output_dir: Path, model_name: str, strat
         "raw_text": data.get("raw_text", ""),
         "extraction": data.get("extraction", [])
     }
-    with open(result_file, 'w', encoding='utf-8') as f:
-        json.dump(file_data, f, indent=2)
+    dump_json(file_data, result_file)
 
 def save_error(pmcid: str, error: str, output_dir: Path):
     """Save error log."""
@@ -90,8 +89,9 @@ def save_error(pmcid: str, error: str, output_dir: Path):
 
 def run_extraction(model_name: str, strategy: str, split: str, 
                    pmcids=None, dry_run: bool = False):
-    # Setup
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Setup (one clock read, so run_name and stats["start_time"] always agree)
+    start_time = datetime.now()
+    timestamp = start_time.strftime("%Y%m%d_%H%M%S")
     run_suffix = "custom" if pmcids else split
     run_name = f"{timestamp}_{model_name}_{strategy}_{run_suffix}"
     output_dir = RESULTS_DIR / run_name
@@ -122,12 +122,11 @@ def run_extraction(model_name: str, strategy: str, split: str,
         "successful": 0,
         "failed": 0,
         "empty": 0,
-        "start_time": datetime.now().strftime("%Y%m%d_%H%M%S"),
+        "start_time": timestamp,
         "total_retries": 0
     }
     
     retry_counts = {pmcid: 0 for pmcid in pmcids}
-    start_time = datetime.now()
     timeout = timedelta(hours=TOTAL_TIMEOUT_HOURS)
     
     # Main loop
@@ -197,8 +196,7 @@ def run_extraction(model_name: str, strategy: str, split: str,
     stats["end_time"] = datetime.now().strftime("%Y%m%d_%H%M%S")
     stats["final_failed"] = list(get_failed_pmcids(output_dir))
     
-    with open(output_dir / "run_metadata.json", 'w') as f:
-        json.dump(stats, f, indent=2)
+    dump_json(stats, output_dir / "run_metadata.json")
 
     # Summary
     print(f"\n{'='*60}")
@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
-from sklearn.metrics import mean_squared_error
+from typing import List, Dict, Any, Hashable
 from difflib import SequenceMatcher
 
 class Evaluator:
@@ -40,9 +39,13 @@ class Evaluator:
                 item.get('outcome', ''),
                 item.get('outcome_type', '')
             )
-            gold_map[pmcid].append(ico_tuple)
+            # One matcher per gold ICO with the target as seq2: SequenceMatcher caches its analysis of seq2,
+            # so each extraction compared against it only pays for set_seq1 + ratio
+            target_str = f"{ico_tuple[0]} {ico_tuple[1]} {ico_tuple[2]}"
+            gold_map[pmcid].append((ico_tuple, SequenceMatcher(None, b=target_str)))
 
         aligned_extractions = []
+        append = aligned_extractions.append
         for item in extractions:
             new_item = item.copy()
             pmcid = str(new_item.get('pmcid'))
@@ -53,9 +56,23 @@ class Evaluator:
                 best_ratio = 0.0
                 best_match = None
                 
-                for cand in candidates:
-                    target_str = f"{cand[0]} {cand[1]} {cand[2]}"
-                    ratio = SequenceMatcher(None, query_str, target_str).ratio()
+                for cand, matcher in candidates:
+                    # An exact copy of the gold ICO scores 1.0 and can't be beaten. Below 200 chars difflib's
+                    # autojunk heuristic is off, so ratio() would return exactly 1.0 here too
+                    if query_str == matcher.b and len(query_str) < 200:
+                        best_ratio = 1.0
+                        best_match = cand
+                        break
+                    matcher.set_seq1(query_str)
+                    # real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio(): skip the full match
+                    # when the bound already shows this candidate can't reach the threshold or beat the best so far
+                    bound = matcher.real_quick_ratio()
+                    if bound < threshold or bound <= best_ratio:
+                        continue
+                    bound = matcher.quick_ratio()
+                    if bound < threshold or bound <= best_ratio:
+                        continue
+                    ratio = matcher.ratio()
                     if ratio > best_ratio:
                         best_ratio = ratio
                         best_match = cand
@@ -66,12 +83,12 @@ class Evaluator:
                     new_item['outcome'] = best_match[2]
                     new_item['outcome_type'] = best_match[3]
             
-            aligned_extractions.append(new_item)
+            append(new_item)
         return aligned_extractions        
 
     def _prepare_long_data(self):
         if self.gold_df.empty:
-            return pd.DataFrame(columns=self.id_cols + ['field', 'gold', 'pred', 'category'])
+            return pd.DataFrame(columns=self.id_cols + ['field', 'gold', 'pred', 'category', 'sq_error'])
         
         gold_keep_vars = [c for c in self.id_cols if c in self.gold_df.columns]
         if 'is_data_in_figure_graphics' in self.gold_df.columns:
@@ -101,52 +118,78 @@ class Evaluator:
         else:
             merged['is_data_in_figure_graphics'] = False
 
-        merged['category'] = merged.apply(self._get_row_category, axis=1)
-        return merged
-
-    def _get_row_category(self, row):
-        gold = row['gold']
-        pred = row['pred']
+        gold = merged['gold'].to_numpy()
+        pred = merged['pred'].to_numpy()
         gold_exists = pd.notna(gold)
         extraction_exists = pd.notna(pred)
-        
-        if gold_exists:
-            if extraction_exists and self._is_match(gold, pred):
-                return 'TP'
-            else:
-                return 'FN' 
-        else:
-            if extraction_exists:
-                return 'FP'
-            else:
-                return 'TN'
-        
-    def _is_match(self, val1, val2, tolerance=1e-3):
+        # Parse every value once; the categories and the squared error both work from these floats
+        gold_num = self._as_float(gold, gold_exists)
+        pred_num = self._as_float(pred, extraction_exists)
+
+        merged['category'] = self._get_categories(gold_exists, extraction_exists, gold_num, pred_num)
+
+        # Squared error wherever both sides have a value; every stats/bootstrap pass reuses it
+        merged['sq_error'] = (gold_num - pred_num) ** 2
+        return merged
+
+    @staticmethod
+    def _as_float(values: np.ndarray, present: np.ndarray) -> np.ndarray:
+        """
+        Converts an object column of gold/extracted values to float64, NaN where missing or unparseable.
+        present is the pd.notna mask of values.
+        """
+        out = np.full(len(values), np.nan)
         try:
-            return np.isclose(float(val1), float(val2), atol=tolerance)
+            # Fast path: one C-level conversion when every present value is numeric (the usual case)
+            out[present] = values[present].astype(np.float64)
         except (ValueError, TypeError):
-            return False
+            # Some value isn't a number: convert one by one and leave the unparseable ones as NaN
+            for i in np.flatnonzero(present):
+                try:
+                    out[i] = float(values[i])
+                except (ValueError, TypeError):
+                    pass
+        return out
+
+    @staticmethod
+    def _get_categories(gold_exists: np.ndarray, extraction_exists: np.ndarray,
+                        gold_num: np.ndarray, pred_num: np.ndarray, tolerance=1e-3) -> np.ndarray:
+        """
+        Categorizes every row at once: with a gold value the row is TP if the extraction matches
+        within tolerance, else FN; without one it is FP if something was extracted, else TN.
+        """
+        # Unparseable values were parsed to NaN, which never compares close
+        is_match = np.isclose(gold_num, pred_num, atol=tolerance)
+        return np.select(
+            [gold_exists & extraction_exists & is_match, gold_exists, extraction_exists],
+            ['TP', 'FN', 'FP'],
+            default='TN'
+        )
 
-    def _compute_stats(self, df_subset):
-        df_subset = df_subset[df_subset['category'] != 'IGNORE']
-        if df_subset.empty:
+    @staticmethod
+    def _compute_stats(df_subset):
+        # Work on the raw arrays: this runs once per bootstrap sample, so pandas overhead adds up
+        category = df_subset['category'].to_numpy()
+        keep = category != 'IGNORE'
+        category = category[keep]
+        if category.size == 0:
             return {
                 "precision": 0.0, "recall": 0.0, "f1": 0.0, "rmse": 0.0,
                 "true_positives": 0, "false_positives": 0, "false_negatives": 0
             }
 
-        counts = df_subset['category'].value_counts()
-        TP = counts.get('TP', 0)
-        FP = counts.get('FP', 0)
-        FN = counts.get('FN', 0)
+        TP = np.count_nonzero(category == 'TP')
+        FP = np.count_nonzero(category == 'FP')
+        FN = np.count_nonzero(category == 'FN')
         
         precision = TP / (TP + FP) if (TP + FP) > 0 else 0.0
         recall = TP / (TP + FN) if (TP + FN) > 0 else 0.0
         f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
         
-        rmse_subset = df_subset[pd.notna(df_subset['gold']) & pd.notna(df_subset['pred'])]
-        if len(rmse_subset) > 0:
-            rmse = np.sqrt(mean_squared_error(rmse_subset['gold'], rmse_subset['pred']))
+        sq_error = df_subset['sq_error'].to_numpy(dtype=np.float64)[keep]
+        sq_error = sq_error[~np.isnan(sq_error)]
+        if sq_error.size:
+            rmse = np.sqrt(np.mean(sq_error))
         else:
             rmse = 0.0
             
@@ -155,18 +198,71 @@ class Evaluator:
             "true_positives": int(TP), "false_positives": int(FP), "false_negatives": int(FN)
         }
 
-    def _calculate_bootstrap_ci(self, df, metric_key, n_iterations=1000, ci=0.95):
-        if df.empty: return 0.0, 0.0
-        scores = []
+    @staticmethod
+    def _calculate_bootstrap_ci(df, metric_keys=("f1", "rmse"), n_iterations=1000, ci=0.95, seed=None, chunk_size=250):
+        """
+        Bootstraps every metric in metric_keys from the same resamples.
+        Returns {metric: (lower, upper)}.
+        """
+        if df.empty: return {metric: (0.0, 0.0) for metric in metric_keys}
+        rng = np.random.default_rng(seed)
         n = len(df)
-        for _ in range(n_iterations):
-            sample = df.sample(n=n, replace=True)
-            stats = self._compute_stats(sample)
-            scores.append(stats[metric_key])
-        
-        lower = np.percentile(scores, (1 - ci) / 2 * 100)
-        upper = np.percentile(scores, (1 + ci) / 2 * 100)
-        return lower, upper
+
+        # Per-row contributions, computed once; each resample is then just a gather + row sum
+        category = df['category'].to_numpy()
+        keep = category != 'IGNORE'
+        is_tp = (category == 'TP').astype(np.int64)
+        is_fp = (category == 'FP').astype(np.int64)
+        is_fn = (category == 'FN').astype(np.int64)
+        sq_error = df['sq_error'].to_numpy(dtype=np.float64)
+        both = keep & ~np.isnan(sq_error)
+        sq_err = np.where(both, sq_error, 0.0)
+        both = both.astype(np.int64)
+
+        scores = {metric: [] for metric in metric_keys}
+        # Resample in chunks so the (iterations x rows) index matrix stays small
+        for start in range(0, n_iterations, chunk_size):
+            idx = rng.integers(0, n, size=(min(chunk_size, n_iterations - start), n))
+            chunk = {}
+
+            if "rmse" in scores:
+                n_both = both[idx].sum(axis=1)
+                sq_sum = sq_err[idx].sum(axis=1)
+                chunk["rmse"] = np.sqrt(np.divide(sq_sum, n_both, out=np.zeros(len(idx)), where=n_both > 0))
+
+            if scores.keys() - {"rmse"}:
+                TP = is_tp[idx].sum(axis=1)
+                FP = is_fp[idx].sum(axis=1)
+                FN = is_fn[idx].sum(axis=1)
+                precision = np.divide(TP, TP + FP, out=np.zeros(len(idx)), where=(TP + FP) > 0)
+                recall = np.divide(TP, TP + FN, out=np.zeros(len(idx)), where=(TP + FN) > 0)
+                p_plus_r = precision + recall
+                f1 = np.divide(2 * precision * recall, p_plus_r, out=np.zeros(len(idx)), where=p_plus_r > 0)
+                chunk.update(precision=precision, recall=recall, f1=f1)
+
+            for metric in metric_keys:
+                scores[metric].append(chunk[metric])
+
+        bounds = {}
+        for metric, values in scores.items():
+            values = np.concatenate(values)
+            bounds[metric] = (np.percentile(values, (1 - ci) / 2 * 100), np.percentile(values, (1 + ci) / 2 * 100))
+        return bounds
+
+    def _compute_stats_with_ci(self, subsets: Dict[Hashable, pd.DataFrame]) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Computes stats for each subset and attaches bootstrap CIs for F1 and RMSE.
+        """
+        results = {key: self._compute_stats(df) for key, df in subsets.items()}
+
+        keys = [key for key, df in subsets.items() if not df.empty]
+        # Independent seed per subset; F1 and RMSE share that subset's resamples
+        seeds = np.random.SeedSequence().spawn(len(keys))
+        for key, seed in zip(keys, seeds):
+            bounds = self._calculate_bootstrap_ci(subsets[key], ("f1", "rmse"), seed=seed)
+            for metric, (lower, upper) in bounds.items():
+                results[key][f"{metric}_ci_lower"], results[key][f"{metric}_ci_upper"] = lower, upper
+        return results
 
     def calculate_metrics(self) -> Dict[str, Any]:
         """
@@ -174,71 +270,40 @@ class Evaluator:
         Returns aggregated, exact match, per-field, and figure-subset metrics.
         """
         scorable_df = self.long_df[self.long_df['category'] != 'IGNORE']
-        
+
+        # Collect every subset that needs stats + CIs, then score them in one batch
+        subsets = {("aggregated", None): scorable_df}
+        for field_name, group in scorable_df.groupby('field'):
+            subsets[("by_field", field_name)] = group
+
+        if 'is_data_in_figure_graphics' in scorable_df.columns:
+            # Filter for rows where the GOLD data was marked as being in a figure
+            fig_group = scorable_df[scorable_df['is_data_in_figure_graphics'] == True]
+            if not fig_group.empty:
+                subsets[("figures", None)] = fig_group
+                for field_name, group in fig_group.groupby('field'):
+                    subsets[("figures_by_field", field_name)] = group
+
+        stats = self._compute_stats_with_ci(subsets)
+
         # 1. Aggregated Metrics (Total)
-        agg_stats = self._compute_stats(scorable_df)
-        if not scorable_df.empty:
-            f1_l, f1_h = self._calculate_bootstrap_ci(scorable_df, "f1")
-            agg_stats["f1_ci_lower"], agg_stats["f1_ci_upper"] = f1_l, f1_h
-            
-            rmse_l, rmse_h = self._calculate_bootstrap_ci(scorable_df, "rmse")
-            agg_stats["rmse_ci_lower"], agg_stats["rmse_ci_upper"] = rmse_l, rmse_h
+        agg_stats = stats[("aggregated", None)]
 
         # 2. Exact Match (ICO level)
-        exact_matches = []
-        if not scorable_df.empty:
-            groups = scorable_df.groupby(self.id_cols)
-            for _, group in groups:
-                is_perfect = group['category'].isin(['TP', 'TN']).all()
-                exact_matches.append(1 if is_perfect else 0)
-        
-        agg_stats['exact_match'] = np.mean(exact_matches) if exact_matches else 0.0
+        # An ICO is an exact match when every one of its fields is TP or TN; one grouped reduction
+        is_perfect = scorable_df['category'].isin(['TP', 'TN']).groupby(
+            [scorable_df[col] for col in self.id_cols]
+        ).all()
+        agg_stats['exact_match'] = is_perfect.mean() if len(is_perfect) else 0.0
 
         # 3. Per-Field Metrics (Breakdown)
-        by_field = {}
-        if not scorable_df.empty:
-            for field_name, group in scorable_df.groupby('field'):
-                field_stats = self._compute_stats(group)
-                if len(group) > 0:
-                    f1_l, f1_h = self._calculate_bootstrap_ci(group, "f1")
-                    field_stats["f1_ci_lower"], field_stats["f1_ci_upper"] = f1_l, f1_h
-                    
-                    rmse_l, rmse_h = self._calculate_bootstrap_ci(group, "rmse")
-                    field_stats["rmse_ci_lower"], field_stats["rmse_ci_upper"] = rmse_l, rmse_h
-                
-                by_field[field_name] = field_stats
+        by_field = {key[1]: s for key, s in stats.items() if key[0] == "by_field"}
 
         # 4. Figure Subset Metrics (Aggregated + Breakdown)
         figures_output = {}
-        if 'is_data_in_figure_graphics' in scorable_df.columns:
-            # Filter for rows where the GOLD data was marked as being in a figure
-            fig_group = scorable_df[scorable_df['is_data_in_figure_graphics'] == True]
-            
-            if not fig_group.empty:
-                # A. Aggregated Figures
-                fig_agg = self._compute_stats(fig_group)
-                f1_l, f1_h = self._calculate_bootstrap_ci(fig_group, "f1")
-                fig_agg["f1_ci_lower"], fig_agg["f1_ci_upper"] = f1_l, f1_h
-                
-                rmse_l, rmse_h = self._calculate_bootstrap_ci(fig_group, "rmse")
-                fig_agg["rmse_ci_lower"], fig_agg["rmse_ci_upper"] = rmse_l, rmse_h
-                
-                figures_output["aggregated"] = fig_agg
-
-                # B. By-Field Figures
-                fig_by_field = {}
-                for field_name, group in fig_group.groupby('field'):
-                    f_stats = self._compute_stats(group)
-                    if len(group) > 0:
-                        f1_l, f1_h = self._calculate_bootstrap_ci(group, "f1")
-                        f_stats["f1_ci_lower"], f_stats["f1_ci_upper"] = f1_l, f1_h
-                        
-                        rmse_l, rmse_h = self._calculate_bootstrap_ci(group, "rmse")
-                        f_stats["rmse_ci_lower"], f_stats["rmse_ci_upper"] = rmse_l, rmse_h
-                    
-                    fig_by_field[field_name] = f_stats
-                
-                figures_output["by_field"] = fig_by_field
+        if ("figures", None) in stats:
+            figures_output["aggregated"] = stats[("figures", None)]
+            figures_output["by_field"] = {key[1]: s for key, s in stats.items() if key[0] == "figures_by_field"}
 
         return {
             "aggregated": agg_stats,
@@ -5,7 +5,7 @@ from typing import List, Tuple, Dict, Any
 from src.utils.data_loader import DataLoader
 from src.prompts.templates import SYSTEM_PROMPT
 
-@dataclass
+@dataclass(slots=True)
 class PromptPayload:
     instruction: str
     target_pdf: Path
@@ -19,6 +19,7 @@ class PromptBuilder:
     """
     def __init__(self, loader: DataLoader):
         self.loader = loader
+        self._few_shot_examples = None
 
     def _build_instruction(self, icos: List[Dict]) -> str:
         """Create an instruction string for a given ICO list."""
@@ -35,6 +36,23 @@ class PromptBuilder:
 
         return SYSTEM_PROMPT.replace("{ico_list}", ico_list_str)
 
+    def _get_few_shot_examples(self) -> List[Dict[str, Any]]:
+        """
+        Builds the few-shot examples once; they are identical for every target PDF in a run.
+        """
+        if self._few_shot_examples is None:
+            few_shot_examples = []
+            for example in self.loader.get_few_shot_examples():
+                example_icos = self.loader.get_icos(example["pmcid"])
+                example_instruction = self._build_instruction(example_icos)
+                few_shot_examples.append({
+                    "pdf_path": example["pdf_path"],
+                    "instruction": example_instruction,
+                    "answer": example["answer"],
+                })
+            self._few_shot_examples = few_shot_examples
+        return list(self._few_shot_examples)
+
     def build(self, target_pmcid: str, mode: str = "zero-shot") -> PromptPayload:
         """
         Accepts target_pmcid and mode ("zero-shot" or "few-shot").
@@ -48,14 +66,7 @@ class PromptBuilder:
 
         few_shot_examples = []
         if mode == "few-shot":
-            for example in self.loader.get_few_shot_examples():
-                example_icos = self.loader.get_icos(example["pmcid"])
-                example_instruction = self._build_instruction(example_icos)
-                few_shot_examples.append({
-                    "pdf_path": example["pdf_path"],
-                    "instruction": example_instruction,
-                    "answer": example["answer"],
-                })
+            few_shot_examples = self._get_few_shot_examples()
 
         return PromptPayload(
             instruction=instruction,
@@ -2,6 +2,11 @@ import json
 import re
 from typing import Any, Dict, List, Union
 
+from src.utils.json_io import loads
+
+_decoder = json.JSONDecoder()
+_JSON_BLOCK_RE = re.compile(r"```json\s*([\s\S]*?)\s*```")
+
 def clean_and_parse_json(raw_text: str) -> Union[Dict, List, None]:
     """
     Robustly find JSON content using regex (e.g., between ```json blocks or first [ / last ]).
@@ -10,8 +15,7 @@ def clean_and_parse_json(raw_text: str) -> Union[Dict, List, None]:
     if not raw_text:
         return None
 
-    json_block_pattern = r"```json\s*([\s\S]*?)\s*```"
-    match = re.search(json_block_pattern, raw_text)
+    match = _JSON_BLOCK_RE.search(raw_text)
 
     candidate_text = raw_text
     if match:
@@ -19,7 +23,7 @@ def clean_and_parse_json(raw_text: str) -> Union[Dict, List, None]:
 
     try:
         cleaned_text = candidate_text.strip()
-        return json.loads(cleaned_text)
+        return loads(cleaned_text)
     except json.JSONDecodeError:
         pass
 
@@ -29,19 +33,17 @@ def clean_and_parse_json(raw_text: str) -> Union[Dict, List, None]:
     last_bracket = candidate_text.rfind(']')
 
     start = -1
-    end = -1
 
     if first_bracket != -1 and last_bracket != -1 and last_bracket > first_bracket:
         start = first_bracket
-        end = last_bracket + 1
     elif first_brace != -1 and last_brace != -1 and last_brace > first_brace:
         start = first_brace
-        end = last_brace + 1
 
     if start != -1:
-        extracted = candidate_text[start:end]
+        # Decode the single value starting here in one linear pass (string-aware, no slice copy);
+        # any trailing prose after its closing bracket is ignored
         try:
-            return json.loads(extracted)
+            return _decoder.raw_decode(candidate_text, start)[0]
         except json.JSONDecodeError:
             pass
 
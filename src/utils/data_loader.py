@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from src.config import GOLD_STANDARD_PATH, PDF_DIR
+from src.utils.json_io import load_json
 
 class DataLoader:
     """
@@ -11,32 +12,44 @@ class DataLoader:
         self.data_path = data_path
         self.pdf_dir = pdf_dir
         self._data = self._load_data()
+        self._by_pmcid = self._index_by_pmcid()
+        self._by_split = self._index_by_split()
 
     def _load_data(self) -> List[Dict]:
         if not self.data_path.exists():
             raise FileNotFoundError(f"Gold standard file not found at {self.data_path}")
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(self.data_path)
+
+    def _index_by_pmcid(self) -> Dict[str, List[Dict]]:
+        """
+        Groups gold standard entries by PMCID in a single pass so lookups don't rescan the data.
+        """
+        index = {}
+        for entry in self._data:
+            index.setdefault(str(entry['pmcid']), []).append(entry)
+        return index
+
+    def _index_by_split(self) -> Dict[str, set]:
+        """
+        Maps each split name to its set of PMCIDs, reusing the already-normalised PMCID index keys.
+        """
+        index = {}
+        for pmcid, entries in self._by_pmcid.items():
+            for entry in entries:
+                index.setdefault(entry.get('split'), set()).add(pmcid)
+        return index
 
     def get_split_pmcids(self, split_name: str) -> List[str]:
         """
         Returns a unique list of PMCIDs belonging to a split (e.g., "TEST", "DEV", "FEW-SHOT").
         """
-        pmcids = {
-            str(entry['pmcid'])
-            for entry in self._data
-            if entry.get('split') == split_name
-        }
-        return sorted(list(pmcids))
+        return sorted(self._by_split.get(split_name, ()))
 
     def get_entry(self, pmcid: str) -> List[Dict]:
         """
         Returns the list of entries in gold standard for a given pmcid.
         """
-        return [
-            entry for entry in self._data
-            if str(entry['pmcid']) == str(pmcid)
-        ]
+        return list(self._by_pmcid.get(str(pmcid), []))
 
     def get_few_shot_examples(self) -> List[Dict[str, object]]:
         """
@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals, which json.dump writes and older result files contain
+            pass
+    return json.loads(data)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file in binary mode (no str decode step for orjson)."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_json(obj: Any, path: Union[str, Path]) -> None:
+    """Write obj as indented JSON. NumPy scalars in metric dicts are serialized as plain numbers."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # orjson refuses integers wider than 64 bits, which raw_decode can hand back from a model reply
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(data)
+            return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2)